@@ -1,10 +1,317 @@
 import time
 import os
 import asyncio
-import platform
 import json
-from typing import Optional, Union, Dict, List, Any
-from googletrans import Translator
+import hashlib
+import logging
+import logging.handlers
+import atexit
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+import uuid
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Union, Dict, List, Any, Tuple, AsyncIterator
+import edge_tts
+import httpx
+
+logger = logging.getLogger(__name__)
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging() -> None:
+    """Configure logging so records are written by a background thread.
+
+    The root logger only enqueues records; a QueueListener formats and writes
+    them, so callers never block on console I/O. The level comes from the
+    LOG_LEVEL environment variable and defaults to INFO. A root logger that
+    already has handlers is left as it is.
+    """
+    global _log_listener
+    if _log_listener is not None or logging.getLogger().handlers:
+        return
+
+    level_name = (os.getenv("LOG_LEVEL") or "INFO").upper()
+    level = logging.getLevelName(level_name)
+    if not isinstance(level, int):
+        level = logging.INFO
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+    # Leave formatting to the listener's handler
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=level, handlers=[queue_handler])
+
+    _log_listener = logging.handlers.QueueListener(log_queue, handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+    if level_name != logging.getLevelName(level):
+        logger.warning("Unknown LOG_LEVEL %r, using INFO", level_name)
+
+
+# Maximum number of translations kept in memory per EdgeTTS instance
+TRANSLATION_CACHE_SIZE = 4096
+
+# Google Translate endpoint, reached through pooled keep-alive HTTP/2 clients
+TRANSLATE_URL = "https://translate.googleapis.com/translate_a/single"
+HTTP_TIMEOUT = 5
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20)
+
+# Shared client for synchronous translations, created on first use
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+# One AsyncClient per event loop, since pooled connections are bound to their loop
+_async_clients: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]"
+) = weakref.WeakKeyDictionary()
+
+
+def _get_http_client() -> httpx.Client:
+    """Return the pooled translation client shared by all EdgeTTS instances"""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                http2=True, timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS
+            )
+        return _http_client
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Return the pooled translation client for the running event loop"""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(http2=True, timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+        _async_clients[loop] = client
+    return client
+
+
+async def aclose_http_client() -> None:
+    """Close the pooled translation client of the running event loop, if any"""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+# Unicode block of the script each supported target language is written in
+_SCRIPT_RANGES: Dict[str, Tuple[int, int]] = {
+    "hi": (0x0900, 0x097F),  # Devanagari
+}
+
+
+def _is_in_script(text: str, language: str) -> bool:
+    """Whether most letters of text already use the script of language"""
+    script_range = _SCRIPT_RANGES.get(language)
+    if script_range is None:
+        return False
+
+    low, high = script_range
+    in_script = letters = 0
+    for c in text:
+        if low <= ord(c) <= high:
+            in_script += 1
+            letters += 1
+        elif c.isalpha():
+            letters += 1
+    return letters > 0 and in_script * 2 >= letters
+
+
+def _translate_params(target_language: str) -> Dict[str, str]:
+    """Query parameters for a translation request"""
+    return {"client": "gtx", "sl": "auto", "tl": target_language, "dt": "t"}
+
+
+def _parse_translation(response: httpx.Response) -> str:
+    """Join the translated sentences of a translate_a/single response"""
+    response.raise_for_status()
+    sentences = response.json()[0] or []
+    return "".join(sentence[0] for sentence in sentences if sentence and sentence[0])
+
+
+# Audio player command for this platform, resolved once at import
+if os.name == "nt":  # Windows
+    _PLAY_ARGV: Optional[List[str]] = ["cmd", "/c", "start", ""]
+elif sys.platform == "darwin":  # macOS
+    _PLAY_ARGV = ["afplay"]
+elif os.name == "posix":  # Linux
+    _PLAY_ARGV = ["aplay"]
+else:
+    _PLAY_ARGV = None
+
+
+def _open_in_browser(file_path: str) -> bool:
+    """Fallback playback that opens the file with the default web browser"""
+    try:
+        import webbrowser
+
+        webbrowser.open(file_path)
+        return True
+    except:
+        logger.error("All audio playback methods failed")
+        return False
+
+
+# Persistent event loop, run on a daemon thread, that serves the sync wrappers
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting it on first use"""
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(
+                target=_loop.run_forever, name="edge-tts-loop", daemon=True
+            )
+            _loop_thread.start()
+        return _loop
+
+
+def _run(coro: Any) -> Any:
+    """Run a coroutine on the background event loop and wait for its result"""
+    if threading.current_thread() is _loop_thread:
+        coro.close()
+        raise RuntimeError("Cannot block on the background loop from its own thread")
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+# Content-addressed cache of synthesized audio, shared with the API output directory
+CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "tts_output", ".cache"
+)
+CACHE_MAX_BYTES = 256 * 1024 * 1024  # Evict least recently used files above this
+STREAM_CHUNK_SIZE = 64 * 1024  # Read size when streaming cached audio
+
+
+def _audio_cache_path(text: str, voice: str, rate: str, volume: str) -> str:
+    """Path of the cached audio for the given text and settings"""
+    key = hashlib.sha256(f"{voice}|{rate}|{volume}|{text}".encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, key + ".mp3")
+
+
+# The voice manifest rarely changes, so it is cached in memory for this long
+VOICES_CACHE_TTL = 24 * 60 * 60
+_voices_cache: Optional[Tuple[List[Dict[str, Any]], float]] = None
+
+# Maximum number of edge-tts sessions opened at once when processing a JSON batch
+BATCH_CONCURRENCY = 8
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hardlink src to dst, falling back to a copy across filesystems.
+
+    dst is swapped in atomically from a fresh temporary name. An existing dst
+    may share its inode with another cache entry, so it is never written to.
+    """
+    tmp = os.path.join(
+        os.path.dirname(os.path.abspath(dst)),
+        f".{os.path.basename(dst)}.{uuid.uuid4().hex}.tmp",
+    )
+    try:
+        try:
+            os.link(src, tmp)
+        except OSError:
+            shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+    finally:
+        if os.path.lexists(tmp):
+            os.remove(tmp)
+
+
+def _evict_audio_cache() -> None:
+    """Remove least recently used cache files until under CACHE_MAX_BYTES"""
+    entries = []
+    total = 0
+    with os.scandir(CACHE_DIR) as it:
+        for entry in it:
+            if entry.is_file() and entry.name.endswith(".mp3"):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+
+    entries.sort()
+    for _, size, path in entries:
+        if total <= CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+def _use_cached_audio(cache_path: str, output_file: str) -> bool:
+    """Link cached audio to output_file if present, marking it as recently used"""
+    try:
+        os.utime(cache_path)
+        _link_or_copy(cache_path, output_file)
+    except FileNotFoundError:
+        # Missing, or evicted by a concurrent request: treat it as a miss
+        return False
+    return True
+
+
+def _store_cached_audio(partial_path: str, cache_path: str, output_file: str) -> None:
+    """Move finished audio into the cache, link it to output_file and trim the cache"""
+    os.replace(partial_path, cache_path)
+    _link_or_copy(cache_path, output_file)
+    _evict_audio_cache()
+
+
+def _discard_file(path: str) -> None:
+    """Remove path if it exists"""
+    if os.path.exists(path):
+        os.remove(path)
+
+
+# Defaults for fields omitted from a JSON request
+DEFAULT_VOICE = "hi-IN-MadhurNeural"
+DEFAULT_RATE = "+0%"
+DEFAULT_VOLUME = "+0%"
+
+
+@dataclass(slots=True)
+class TTSRequest:
+    """A single text-to-speech request from a JSON batch"""
+
+    text: str
+    voice: str = DEFAULT_VOICE
+    rate: str = DEFAULT_RATE
+    volume: str = DEFAULT_VOLUME
+    translate_to_hindi: bool = False
+    output_file: str = ""
+
+    @classmethod
+    def from_dict(cls, request: Dict[str, Any], index: int) -> "TTSRequest":
+        """Build a request from its JSON object at position index in the batch"""
+        return cls(
+            text=request.get("text", ""),
+            voice=request.get("voice", DEFAULT_VOICE),
+            rate=request.get("rate", DEFAULT_RATE),
+            volume=request.get("volume", DEFAULT_VOLUME),
+            translate_to_hindi=request.get("translate_to_hindi", False),
+            output_file=request.get("output_file", f"output_{index+1}.mp3"),
+        )
+
+
+def parse_requests(requests: List[Dict[str, Any]]) -> List[TTSRequest]:
+    """Parse the 'requests' array of a JSON batch once, up front"""
+    return [TTSRequest.from_dict(request, i) for i, request in enumerate(requests)]
 
 
 class EdgeTTS:
@@ -12,32 +319,82 @@ class EdgeTTS:
         self.voice = "hi-IN-MadhurNeural"  # Default voice
         self.rate = "+0%"  # Normal speed
         self.volume = "+0%"  # Normal volume
-        self.translator = Translator()
+        # LRU cache of translations keyed by (text digest, target language)
+        self._translation_cache: "OrderedDict[Tuple[bytes, str], str]" = OrderedDict()
 
-    async def _generate_speech(self, text: str, output_file: str) -> bool:
-        """Generate speech using edge-tts"""
+    async def _generate_speech(
+        self, text: str, output_file: str, *, voice: str, rate: str, volume: str
+    ) -> bool:
+        """Generate speech using edge-tts, reusing cached audio when possible.
+
+        Settings are passed per call and never read from the instance, so
+        concurrent calls can safely share one EdgeTTS.
+        """
         try:
-            # Import from the installed package
-            import edge_tts
+            cache_path = _audio_cache_path(text, voice, rate, volume)
 
-            # Create communicator
-            # NOTE: We're using the compatible syntax without 'options' parameter
-            communicate = edge_tts.Communicate(text, self.voice)
+            # Serve identical requests from the cache without contacting edge-tts
+            if await asyncio.to_thread(_use_cached_audio, cache_path, output_file):
+                return True
 
-            # Set rate and volume using the communicate setter methods, if they exist
-            # This is the compatible way to handle different edge-tts versions
-            if hasattr(communicate, "set_rate"):
-                communicate.set_rate(self.rate)
-            if hasattr(communicate, "set_volume"):
-                communicate.set_volume(self.volume)
+            # Create communicator
+            communicate = edge_tts.Communicate(text, voice, rate=rate, volume=volume)
 
-            # Generate speech
-            await communicate.save(output_file)
+            # Generate speech into the cache, then expose it as the output file
+            await asyncio.to_thread(os.makedirs, CACHE_DIR, exist_ok=True)
+            partial_path = f"{cache_path}.{os.getpid()}.{id(communicate)}.part"
+            try:
+                await communicate.save(partial_path)
+                await asyncio.to_thread(
+                    _store_cached_audio, partial_path, cache_path, output_file
+                )
+            finally:
+                await asyncio.to_thread(_discard_file, partial_path)
             return True
         except Exception as e:
-            print(f"Error generating speech: {str(e)}")
+            logger.error("Error generating speech: %s", e)
             return False
 
+    async def stream_speech(
+        self, text: str, output_file: str, *, voice: str, rate: str, volume: str
+    ) -> AsyncIterator[bytes]:
+        """Yield MP3 audio as edge-tts produces it.
+
+        The audio is teed into the cache and linked to output_file once the
+        stream completes, exactly as _generate_speech would have left it.
+        Errors are raised to the caller.
+        """
+        cache_path = _audio_cache_path(text, voice, rate, volume)
+
+        # Serve identical requests from the cache without contacting edge-tts
+        cached = None
+        if await asyncio.to_thread(_use_cached_audio, cache_path, output_file):
+            try:
+                cached = await asyncio.to_thread(open, cache_path, "rb")
+            except FileNotFoundError:
+                pass  # Evicted since the hit; synthesize it again
+        if cached is not None:
+            with cached as f:
+                while chunk := await asyncio.to_thread(f.read, STREAM_CHUNK_SIZE):
+                    yield chunk
+            return
+
+        communicate = edge_tts.Communicate(text, voice, rate=rate, volume=volume)
+
+        await asyncio.to_thread(os.makedirs, CACHE_DIR, exist_ok=True)
+        partial_path = f"{cache_path}.{os.getpid()}.{id(communicate)}.part"
+        try:
+            with await asyncio.to_thread(open, partial_path, "wb") as f:
+                async for chunk in communicate.stream():
+                    if chunk["type"] == "audio":
+                        await asyncio.to_thread(f.write, chunk["data"])
+                        yield chunk["data"]
+            await asyncio.to_thread(
+                _store_cached_audio, partial_path, cache_path, output_file
+            )
+        finally:
+            await asyncio.to_thread(_discard_file, partial_path)
+
     def set_voice(self, voice: str) -> None:
         """Set the voice to use"""
         self.voice = voice
@@ -50,44 +407,140 @@ class EdgeTTS:
         """Set volume (e.g., '+10%', '-20%')"""
         self.volume = volume
 
+    def _translation_key(self, text: str, target_language: str) -> Tuple[bytes, str]:
+        """Cache key for a translation"""
+        return (
+            hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(),
+            target_language,
+        )
+
+    def _get_cached_translation(self, key: Tuple[bytes, str]) -> Optional[str]:
+        """Look up a cached translation and mark it as recently used"""
+        cached = self._translation_cache.get(key)
+        if cached is not None:
+            self._translation_cache.move_to_end(key)
+        return cached
+
+    def _cache_translation(self, key: Tuple[bytes, str], translated: str) -> None:
+        """Store a translation, evicting the least recently used one if full"""
+        self._translation_cache[key] = translated
+        if len(self._translation_cache) > TRANSLATION_CACHE_SIZE:
+            self._translation_cache.popitem(last=False)
+
     def translate_text(self, text: str, target_language: str = "hi") -> str:
-        """Translate text to the target language"""
+        """Translate text to the target language, reusing cached results"""
+        # Text already written in the target script needs no round trip
+        if _is_in_script(text, target_language):
+            return text
+
+        key = self._translation_key(text, target_language)
+        cached = self._get_cached_translation(key)
+        if cached is not None:
+            return cached
+
         try:
-            translation = self.translator.translate(text, dest=target_language)
-            return translation.text
+            response = _get_http_client().post(
+                TRANSLATE_URL,
+                params=_translate_params(target_language),
+                data={"q": text},
+            )
+            translated = _parse_translation(response)
+            self._cache_translation(key, translated)
+            return translated
         except Exception as e:
-            print(f"Translation error: {str(e)}")
+            logger.warning("Translation error: %s", e)
             return text  # Return original text if translation fails
 
+    async def translate_text_async(self, text: str, target_language: str = "hi") -> str:
+        """Async version of translate_text using the event loop's pooled client"""
+        translated, _ = await self.try_translate_text_async(text, target_language)
+        return translated
+
+    async def try_translate_text_async(
+        self, text: str, target_language: str = "hi"
+    ) -> Tuple[str, bool]:
+        """Like translate_text_async, but also report whether translation succeeded"""
+        # Text already written in the target script needs no round trip
+        if _is_in_script(text, target_language):
+            return text, True
+
+        key = self._translation_key(text, target_language)
+        cached = self._get_cached_translation(key)
+        if cached is not None:
+            return cached, True
+
+        try:
+            response = await _get_async_client().post(
+                TRANSLATE_URL,
+                params=_translate_params(target_language),
+                data={"q": text},
+            )
+            translated = _parse_translation(response)
+            self._cache_translation(key, translated)
+            return translated, True
+        except Exception as e:
+            logger.warning("Translation error: %s", e)
+            return text, False  # Return original text if translation fails
+
+    async def translate_batch_async(
+        self, texts: List[str], target_language: str = "hi"
+    ) -> List[str]:
+        """Translate several texts concurrently, at most BATCH_CONCURRENCY at a time"""
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        async def translate(text: str) -> str:
+            async with semaphore:
+                return await self.translate_text_async(text, target_language)
+
+        # Repeated texts are translated once
+        unique = list(dict.fromkeys(texts))
+        translated = dict(
+            zip(unique, await asyncio.gather(*(translate(text) for text in unique)))
+        )
+        return [translated[text] for text in texts]
+
     async def speak_async(
         self,
         text: str,
         output_file: str = "output.mp3",
         translate_to_hindi: bool = False,
+        *,
+        voice: Optional[str] = None,
+        rate: Optional[str] = None,
+        volume: Optional[str] = None,
     ) -> bool:
-        """Async version of speak method with optional translation"""
+        """Async version of speak method with optional translation.
+
+        voice, rate and volume override the instance settings for this call only.
+        """
         try:
             start_time = time.time()
 
             # Translate if needed
             if translate_to_hindi:
-                text = self.translate_text(text, "hi")
-                print(f"Translated text: {text}")
+                text = await self.translate_text_async(text, "hi")
+                logger.debug("Translated text: %s", text)
 
             # Generate speech
-            success = await self._generate_speech(text, output_file)
+            success = await self._generate_speech(
+                text,
+                output_file,
+                voice=voice or self.voice,
+                rate=rate or self.rate,
+                volume=volume or self.volume,
+            )
             if not success:
                 return False
 
             process_time = time.time() - start_time
-            print(f"Text processed in {process_time:.2f} seconds")
+            logger.debug("Text processed in %.2f seconds", process_time)
 
             # Play the audio
-            print("Playing audio...")
-            self.play_audio(output_file)
+            logger.debug("Playing audio: %s", output_file)
+            await self._play_audio_async(output_file)
             return True
         except Exception as e:
-            print(f"Error in Edge TTS: {str(e)}")
+            logger.error("Error in Edge TTS: %s", e)
             return False
 
     def speak(
@@ -97,105 +550,61 @@ class EdgeTTS:
         translate_to_hindi: bool = False,
     ) -> bool:
         """Convert text to speech and play it - wrapper for async version"""
-        # Use a different approach that avoids nested event loops
-        try:
-            # Create a separate event loop
-            loop = asyncio.new_event_loop()
-            try:
-                return loop.run_until_complete(
-                    self.speak_async(text, output_file, translate_to_hindi)
-                )
-            finally:
-                loop.close()
-        except RuntimeError as e:
-            if "already running" in str(e):
-                # If we're already in an event loop, we need to use a different approach
-                print(
-                    "Note: Running in existing event loop, some features may be limited"
-                )
-
-                # Create a background thread to run the TTS
-                import threading
-
-                result = [False]  # To store the result
-
-                def run_in_thread():
-                    # Create a new event loop for this thread
-                    thread_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(thread_loop)
-                    try:
-                        result[0] = thread_loop.run_until_complete(
-                            self.speak_async(text, output_file, translate_to_hindi)
-                        )
-                    finally:
-                        thread_loop.close()
-
-                # Start thread
-                thread = threading.Thread(target=run_in_thread)
-                thread.start()
-                thread.join()  # Wait for completion
-
-                return result[0]
-            else:
-                raise
+        # Runs on the shared background loop, so this also works when called
+        # from code that already has an event loop running
+        return _run(self.speak_async(text, output_file, translate_to_hindi))
+
+    async def _play_audio_async(self, file_path: str) -> bool:
+        """Play audio file without blocking the event loop"""
+        if _PLAY_ARGV is None:
+            logger.warning("Unsupported platform for audio playback")
+            return False
 
-    def play_audio(self, file_path: str) -> bool:
-        """Play audio file using the appropriate method for the platform"""
         try:
-            # Try using native Windows playback
-            if os.name == "nt":  # Windows
-                from os import system
-
-                system(f'start "" "{file_path}"')
-                return True
-
-            # Try using native macOS playback
-            elif os.name == "posix" and platform.system() == "Darwin":  # macOS
-                from os import system
-
-                system(f'afplay "{file_path}"')
-                return True
-
-            # Try using aplay on Linux
-            elif os.name == "posix":  # Linux
-                from os import system
-
-                system(f'aplay "{file_path}"')
-                return True
+            # Run the platform player directly, without a shell
+            proc = await asyncio.create_subprocess_exec(*_PLAY_ARGV, file_path)
+            await proc.wait()
+            return True
+        except Exception as e:
+            logger.warning("Error playing audio: %s", e)
+            return _open_in_browser(file_path)
 
-            else:
-                print("Unsupported platform for audio playback")
-                return False
+    def play_audio(self, file_path: str) -> bool:
+        """Start playing audio file using the appropriate method for the platform"""
+        if _PLAY_ARGV is None:
+            logger.warning("Unsupported platform for audio playback")
+            return False
 
+        try:
+            subprocess.Popen(_PLAY_ARGV + [file_path])
+            return True
         except Exception as e:
-            print(f"Error playing audio: {str(e)}")
+            logger.warning("Error playing audio: %s", e)
+            return _open_in_browser(file_path)
 
-            # Fallback method using webbrowser to open the file
-            try:
-                import webbrowser
 
-                webbrowser.open(file_path)
-                return True
-            except:
-                print("All audio playback methods failed")
-                return False
+async def list_voices() -> List[Dict[str, Any]]:
+    """List all available voices and return them as a list.
 
+    The result is cached for VOICES_CACHE_TTL seconds.
+    """
+    global _voices_cache
+    if _voices_cache and _voices_cache[1] > time.time():
+        return list(_voices_cache[0])
 
-async def list_voices() -> List[Dict[str, Any]]:
-    """List all available voices and return them as a list"""
     try:
-        # Import from the installed package
-        import edge_tts
-
         voices = await edge_tts.list_voices()
-        print("Available voices:")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Available voices:")
         result = []
 
         for voice in voices:
             # The field names have changed in newer versions
             friendly_name = voice.get("FriendlyName", voice.get("Name", "Unknown"))
             gender = voice.get("Gender", "Unknown")
-            print(f"- {voice['ShortName']}: {friendly_name} ({gender})")
+            if debug:
+                logger.debug("- %s: %s (%s)", voice["ShortName"], friendly_name, gender)
 
             result.append(
                 {
@@ -206,12 +615,10 @@ async def list_voices() -> List[Dict[str, Any]]:
                 }
             )
 
-        return result
+        _voices_cache = (result, time.time() + VOICES_CACHE_TTL)
+        return list(result)
     except Exception as e:
-        import traceback
-
-        print(f"Error listing voices: {str(e)}")
-        traceback.print_exc()
+        logger.exception("Error listing voices: %s", e)
         return []
 
 
@@ -234,59 +641,86 @@ async def get_voices() -> List[Dict[str, Any]]:
     return await list_voices()
 
 
-def process_json_input(json_file_path: str) -> bool:
-    """Process text-to-speech requests from a JSON file"""
-    try:
-        # Read and parse the JSON file
-        with open(json_file_path, "r", encoding="utf-8") as file:
-            data = json.load(file)
+async def _process_json_async(json_file_path: str) -> bool:
+    """Synthesize JSON requests concurrently and play the results in order"""
+    # Read and parse the JSON file
+    with open(json_file_path, "r", encoding="utf-8") as file:
+        data = json.load(file)
 
-        # Create TTS engine
-        tts = EdgeTTS()
-
-        # Process each request in the JSON
-        for i, request in enumerate(data.get("requests", [])):
-            # Extract parameters with defaults
-            text = request.get("text", "")
-            voice = request.get("voice", "hi-IN-MadhurNeural")
-            rate = request.get("rate", "+0%")
-            volume = request.get("volume", "+0%")
-            translate_to_hindi = request.get("translate_to_hindi", False)
-            output_file = request.get("output_file", f"output_{i+1}.mp3")
-
-            # Skip empty texts
-            if not text:
-                print(f"Skipping request #{i+1}: Empty text")
-                continue
-
-            print(f"Processing request #{i+1}: '{text[:30]}...' with voice {voice}")
+    # Create TTS engine shared by all requests; settings are passed per call
+    tts = EdgeTTS()
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    # Skip empty texts
+    requests = []
+    for i, request in enumerate(parse_requests(data.get("requests", []))):
+        if request.text:
+            requests.append((i, request))
+        else:
+            logger.info("Skipping request #%d: Empty text", i + 1)
+
+    # Translate everything that needs it in one batch before synthesis
+    to_translate = [
+        (i, request) for i, request in requests if request.translate_to_hindi
+    ]
+    translations = await tts.translate_batch_async(
+        [request.text for _, request in to_translate], "hi"
+    )
+    for (i, request), text in zip(to_translate, translations):
+        request.text = text
+        logger.debug("Translated request #%d: %s", i + 1, text)
+
+    async def synthesize(i: int, request: TTSRequest) -> Optional[str]:
+        async with semaphore:
+            logger.info(
+                "Processing request #%d: '%s...' with voice %s",
+                i + 1,
+                request.text[:30],
+                request.voice,
+            )
+            success = await tts._generate_speech(
+                request.text,
+                request.output_file,
+                voice=request.voice,
+                rate=request.rate,
+                volume=request.volume,
+            )
+            return request.output_file if success else None
 
-            # Configure TTS
-            tts.set_voice(voice)
-            tts.set_rate(rate)
-            tts.set_volume(volume)
+    # Process each request in the JSON
+    tasks = [asyncio.ensure_future(synthesize(i, request)) for i, request in requests]
 
-            # Speak the text
-            tts.speak(text, output_file, translate_to_hindi)
+    # Play finished files in request order while later ones are still synthesizing
+    for task in tasks:
+        try:
+            result = await task
+        except Exception as e:
+            logger.error("Error processing request: %s", e)
+            continue
+        if result:
+            logger.info("Playing audio: %s", result)
+            await tts._play_audio_async(result)
 
-            # Give a pause between requests
-            time.sleep(1)
+    return True
 
-        return True
 
+def process_json_input(json_file_path: str) -> bool:
+    """Process text-to-speech requests from a JSON file"""
+    try:
+        return _run(_process_json_async(json_file_path))
     except Exception as e:
-        print(f"Error processing JSON input: {str(e)}")
+        logger.error("Error processing JSON input: %s", e)
         return False
 
 
 # Run the main function if this file is executed directly
 if __name__ == "__main__":
-    import sys
+    setup_logging()
 
     if len(sys.argv) > 1:
         # Use the JSON file provided as an argument
         json_file = sys.argv[1]
-        print(f"Processing TTS requests from: {json_file}")
+        logger.info("Processing TTS requests from: %s", json_file)
         process_json_input(json_file)
     else:
         print("Usage: python text_to_speech_fixed.py <json_file>")
@@ -314,6 +748,6 @@ if __name__ == "__main__":
         with open(example_file, "w", encoding="utf-8") as f:
             json.dump(example_json, f, indent=2)
 
-        print(f"Created example file: {example_file}")
-        print("Processing example file...")
+        logger.info("Created example file: %s", example_file)
+        logger.info("Processing example file...")
         process_json_input(example_file)
@@ -1,14 +1,28 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.background import BackgroundTask
 import os
+import stat
 import json
-import tempfile
-import shutil
-from typing import Optional
+import logging
+import time
+import hashlib
+from collections import OrderedDict
+from typing import Optional, List, Tuple, Dict, Any
+from urllib.parse import quote
 import asyncio
 
 # Import from our TTS module
-from main import EdgeTTS
+from main import (
+    EdgeTTS,
+    aclose_http_client,
+    setup_logging,
+    list_voices,
+    parse_requests,
+)
+
+setup_logging()
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="Simple Edge TTS API",
@@ -19,11 +33,108 @@ app = FastAPI(
 # Create a directory for audio files if it doesn't exist
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tts_output")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
-print(f"Output directory created at: {OUTPUT_DIR}")
+logger.info("Output directory created at: %s", OUTPUT_DIR)
 
 # Global TTS instance
 tts_engine = EdgeTTS()
 
+# Uploads larger than this are parsed in a worker thread to keep the event loop free
+JSON_INLINE_PARSE_LIMIT = 64 * 1024
+
+# Responses to recently seen uploads, keyed by a hash of the upload and options.
+# Each entry holds (expires_at, output files, file identities at caching time).
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_TTL = 60 * 60
+_response_cache: (
+    "OrderedDict[str, Tuple[float, List[str], List[Tuple[int, int, int]]]]"
+) = OrderedDict()
+
+# Background edge-tts warm-up started at startup
+_warm_up_task: Optional["asyncio.Task[List[Dict[str, Any]]]"] = None
+
+
+def parse_upload(content: bytes):
+    """Decode and parse an uploaded JSON document"""
+    return json.loads(content.decode("utf-8"))
+
+
+def _file_identities(paths: List[str]) -> Optional[List[Tuple[int, int, int]]]:
+    """(device, inode, size) of each file, or None if any is missing"""
+    try:
+        identities = []
+        for path in paths:
+            st = os.stat(path)
+            identities.append((st.st_dev, st.st_ino, st.st_size))
+        return identities
+    except OSError:
+        return None
+
+
+async def get_cached_response_files(key: str) -> Optional[List[str]]:
+    """Output files of a cached response, if still fresh and not overwritten"""
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+
+    expires_at, output_files, identities = entry
+    if expires_at > time.time() and identities == await asyncio.to_thread(
+        _file_identities, output_files
+    ):
+        # A concurrent request may have evicted the entry during the stat
+        if key in _response_cache:
+            _response_cache.move_to_end(key)
+        return output_files
+
+    _response_cache.pop(key, None)
+    return None
+
+
+async def cache_response_files(key: str, output_files: List[str]) -> None:
+    """Remember the output files generated for an upload"""
+    identities = await asyncio.to_thread(_file_identities, output_files)
+    if identities is None:
+        return
+
+    _response_cache[key] = (time.time() + RESPONSE_CACHE_TTL, output_files, identities)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+
+
+def files_response(output_files: List[str]):
+    """Response for a list of generated speech files"""
+    if len(output_files) == 1:
+        # If only one file was generated, return it directly
+        return FileResponse(
+            output_files[0],
+            media_type="audio/mpeg",
+            filename=os.path.basename(output_files[0]),
+        )
+    else:
+        # If multiple files were generated, return information about them
+        return {
+            "message": f"Generated {len(output_files)} audio files",
+            "files": [os.path.basename(f) for f in output_files],
+            "note": "Use /get-file/FILENAME to download each file",
+        }
+
+
+@app.on_event("startup")
+async def warm_up_edge_tts():
+    """Contact the edge-tts service once so the first /tts request starts warm"""
+    global _warm_up_task
+    # Runs in the background so a slow service cannot hold up startup. It also
+    # fills the voice list cache; list_voices reports its own errors
+    _warm_up_task = asyncio.create_task(list_voices())
+
+
+@app.on_event("shutdown")
+async def close_http_client():
+    """Close pooled translation connections on shutdown"""
+    if _warm_up_task is not None:
+        _warm_up_task.cancel()
+    await aclose_http_client()
+
 
 @app.get("/")
 async def root():
@@ -41,33 +152,79 @@ async def generate_speech(
     volume: str,
     output_file: str,
     translate_to_hindi: bool,
-) -> bool:
-    """Generate speech file asynchronously"""
+) -> Tuple[bool, bool]:
+    """Generate speech file asynchronously.
+
+    Returns (success, complete); complete is False when the translation failed
+    and the original text was spoken instead.
+    """
     try:
-        print(f"Generating speech: '{text[:30]}...'")
+        logger.debug("Generating speech: '%s...'", text[:30])
 
-        # Configure TTS
-        tts_engine.set_voice(voice)
-        tts_engine.set_rate(rate)
-        tts_engine.set_volume(volume)
+        complete = True
+        if translate_to_hindi:
+            text, complete = await tts_engine.try_translate_text_async(text, "hi")
 
-        # Generate speech
+        # Generate speech; settings are passed per call because tts_engine is
+        # shared by all concurrent requests
         success = await tts_engine.speak_async(
-            text, output_file=output_file, translate_to_hindi=translate_to_hindi
+            text,
+            output_file=output_file,
+            voice=voice,
+            rate=rate,
+            volume=volume,
         )
 
         if success:
-            print(f"Speech generation successful: {output_file}")
+            logger.debug("Speech generation successful: %s", output_file)
         else:
-            print(f"Speech generation failed")
+            logger.warning("Speech generation failed: %s", output_file)
 
-        return success
+        return success, complete
     except Exception as e:
-        print(f"Error generating speech: {str(e)}")
-        import traceback
+        logger.exception("Error generating speech: %s", e)
+        return False, False
 
-        traceback.print_exc()
-        return False
+
+async def stream_speech_response(
+    text: str,
+    voice: str,
+    rate: str,
+    volume: str,
+    output_file: str,
+    background: Optional[BackgroundTask] = None,
+) -> Optional[StreamingResponse]:
+    """Stream speech to the client as it is synthesized, or None on failure"""
+    chunks = tts_engine.stream_speech(
+        text, output_file, voice=voice, rate=rate, volume=volume
+    )
+
+    # Wait for the first chunk so failures can still be reported as JSON
+    try:
+        first_chunk = await chunks.__anext__()
+    except Exception as e:
+        logger.error("Error generating speech: %s", e)
+        await chunks.aclose()
+        return None
+
+    async def body():
+        yield first_chunk
+        async for chunk in chunks:
+            yield chunk
+
+    filename = os.path.basename(output_file)
+    quoted = quote(filename)
+    if quoted != filename:
+        disposition = f"attachment; filename*=utf-8''{quoted}"
+    else:
+        disposition = f'attachment; filename="{filename}"'
+
+    return StreamingResponse(
+        body(),
+        media_type="audio/mpeg",
+        headers={"Content-Disposition": disposition},
+        background=background,
+    )
 
 
 @app.post("/tts")
@@ -75,26 +232,28 @@ async def process_tts_json(
     file: UploadFile = File(...), return_first_only: Optional[bool] = Form(False)
 ):
     """Process a JSON file with TTS requests and return the generated speech file(s)"""
-    # Create a temporary directory for processing
-    temp_dir = tempfile.mkdtemp()
-    json_path = os.path.join(temp_dir, "input.json")
-
     try:
-        # Save the uploaded file
-        with open(json_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+        # Parse the upload directly from memory
+        content = await file.read()
 
-        # Print file content for debugging
-        with open(json_path, "r", encoding="utf-8") as f:
-            file_content = f.read()
-            print(f"Received JSON content: {file_content}")
+        # Identical uploads are answered from the response cache without any work
+        cache_key = hashlib.sha256(
+            content + (b"\x01" if return_first_only else b"\x00")
+        ).hexdigest()
+        cached_files = await get_cached_response_files(cache_key)
+        if cached_files:
+            logger.debug("Serving cached response for upload %s", cache_key[:12])
+            return files_response(cached_files)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received JSON content: %r", content[:500])
 
-        # Parse the JSON
         try:
-            with open(json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            if len(content) > JSON_INLINE_PARSE_LIMIT:
+                data = await asyncio.to_thread(parse_upload, content)
+            else:
+                data = parse_upload(content)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
             return {"error": f"Invalid JSON format: {str(e)}"}
 
         # Check if the JSON has the expected structure
@@ -104,81 +263,91 @@ async def process_tts_json(
         if not data["requests"]:
             return {"error": "No requests found in JSON"}
 
-        # Keep track of generated files
-        output_files = []
+        requests = parse_requests(data["requests"])
+
+        # Stream only the first request if return_first_only is True
+        if return_first_only:
+            req = requests[0]
+            if not req.text:
+                return {"error": "No speech files could be generated"}
+
+            text = req.text
+            translated = True
+            if req.translate_to_hindi:
+                text, translated = await tts_engine.try_translate_text_async(text, "hi")
+
+            output_path = os.path.join(OUTPUT_DIR, req.output_file)
+            response = await stream_speech_response(
+                text,
+                req.voice,
+                req.rate,
+                req.volume,
+                output_path,
+                # Only runs once the whole stream was sent successfully; audio
+                # of untranslated text is not cached so a retry translates again
+                background=(
+                    BackgroundTask(cache_response_files, cache_key, [output_path])
+                    if translated
+                    else None
+                ),
+            )
+            if response is None:
+                return {"error": "No speech files could be generated"}
+            return response
 
-        # Process only the first request if return_first_only is True
-        requests_to_process = (
-            data["requests"][:1] if return_first_only else data["requests"]
-        )
+        # Keep track of generated files, and whether every request succeeded
+        output_files = []
+        complete = True
 
         # Process each request
-        for i, req in enumerate(requests_to_process):
-            text = req.get("text", "")
-            if not text:
+        for req in requests:
+            if not req.text:
                 continue
 
-            voice = req.get("voice", "hi-IN-MadhurNeural")
-            rate = req.get("rate", "+0%")
-            volume = req.get("volume", "+0%")
-            translate_to_hindi = req.get("translate_to_hindi", False)
-
-            # Create output filename
-            output_filename = req.get("output_file", f"output_{i+1}.mp3")
-            output_path = os.path.join(OUTPUT_DIR, output_filename)
-
             # Generate speech
-            success = await generate_speech(
-                text, voice, rate, volume, output_path, translate_to_hindi
+            output_path = os.path.join(OUTPUT_DIR, req.output_file)
+            success, translated = await generate_speech(
+                req.text,
+                req.voice,
+                req.rate,
+                req.volume,
+                output_path,
+                req.translate_to_hindi,
             )
 
             if success:
                 output_files.append(output_path)
+            complete = complete and success and translated
 
         # Return the appropriate response
         if not output_files:
             return {"error": "No speech files could be generated"}
 
-        if return_first_only and output_files:
-            # Return the first generated file
-            return FileResponse(
-                output_files[0],
-                media_type="audio/mpeg",
-                filename=os.path.basename(output_files[0]),
-            )
-        elif len(output_files) == 1:
-            # If only one file was generated, return it directly
-            return FileResponse(
-                output_files[0],
-                media_type="audio/mpeg",
-                filename=os.path.basename(output_files[0]),
-            )
-        else:
-            # If multiple files were generated, return information about them
-            return {
-                "message": f"Generated {len(output_files)} audio files",
-                "files": [os.path.basename(f) for f in output_files],
-                "note": "Use /get-file/FILENAME to download each file",
-            }
+        # Partial results are not cached so a retry regenerates the failures
+        if complete:
+            await cache_response_files(cache_key, output_files)
+        return files_response(output_files)
 
     except Exception as e:
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("Error processing request: %s", e)
         return {"error": f"Error processing request: {str(e)}"}
-    finally:
-        # Clean up the temporary directory
-        shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 @app.get("/get-file/{filename}")
 async def get_file(filename: str):
     """Get a generated speech file by filename"""
     file_path = os.path.join(OUTPUT_DIR, filename)
-    if not os.path.exists(file_path):
+    try:
+        st = await asyncio.to_thread(os.stat, file_path)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         raise HTTPException(status_code=404, detail=f"File {filename} not found")
 
-    return FileResponse(file_path, media_type="audio/mpeg", filename=filename)
+    # Reuse the stat result so FileResponse does not stat the file again
+    return FileResponse(
+        file_path, stat_result=st, media_type="audio/mpeg", filename=filename
+    )
 
 
 @app.get("/test")
@@ -189,7 +358,7 @@ async def test_tts():
         test_file = os.path.join(OUTPUT_DIR, "test_output.mp3")
 
         # Generate speech
-        success = await generate_speech(
+        success, _ = await generate_speech(
             "This is a test of the Edge TTS API.",
             "en-US-GuyNeural",
             "+0%",
@@ -198,19 +367,17 @@ async def test_tts():
             False,
         )
 
-        if success and os.path.exists(test_file):
+        if success and await asyncio.to_thread(os.path.exists, test_file):
             return {
                 "status": "success",
                 "message": "TTS test successful",
-                "file_size": os.path.getsize(test_file),
+                "file_size": await asyncio.to_thread(os.path.getsize, test_file),
                 "download_url": "/get-file/test_output.mp3",
             }
         else:
             return {"status": "error", "message": "TTS test failed"}
     except Exception as e:
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("TTS test error: %s", e)
         return {"status": "error", "message": f"TTS test error: {str(e)}"}
 
 